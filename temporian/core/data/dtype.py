@@ -37,11 +37,11 @@ class DType(Enum):
 
     @property
     def is_float(self) -> bool:
-        return self in (DType.FLOAT64, DType.FLOAT32)
+        return self in _FLOAT_DTYPES
 
     @property
     def is_integer(self) -> bool:
-        return self in (DType.INT64, DType.INT32)
+        return self in _INTEGER_DTYPES
 
     @property
     def is_numerical(self) -> bool:
@@ -90,6 +90,12 @@ class DType(Enum):
             ) from e
 
 
+# Groups of dtypes used in membership checks. Tuples are faster than sets here
+# since the lookup of an Enum member in a set calls its Python-level __hash__.
+_FLOAT_DTYPES = (DType.FLOAT64, DType.FLOAT32)
+_INTEGER_DTYPES = (DType.INT64, DType.INT32)
+_INDEX_DTYPES = (DType.INT32, DType.INT64, DType.STRING)
+
 PY_TYPE_TO_DTYPE = {
     float: DType.FLOAT64,
     int: DType.INT64,
@@ -120,7 +126,7 @@ IndexDType = DType
 
 
 def check_is_valid_index_dtype(dtype: DType):
-    if dtype not in [DType.INT32, DType.INT64, DType.STRING]:
+    if dtype not in _INDEX_DTYPES:
         raise ValueError(
             f"Trying to create an index with dtype={dtype}. The dtype of an"
             " index can only be int32, int64 or string."
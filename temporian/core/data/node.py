@@ -249,7 +249,12 @@ def input_node(
 class Sampling:
     """A sampling is a reference to the way data is sampled."""
 
-    creator: Optional[Operator] = None
+    __slots__ = ("creator",)
+
+    creator: Optional[Operator]
+
+    def __init__(self, creator: Optional[Operator] = None):
+        self.creator = creator
 
     def __hash__(self):
         return id(self)
@@ -262,7 +267,12 @@ class Sampling:
 class Feature:
     """A feature is a reference to sampled data."""
 
-    creator: Optional[Operator] = None
+    __slots__ = ("creator",)
+
+    creator: Optional[Operator]
+
+    def __init__(self, creator: Optional[Operator] = None):
+        self.creator = creator
 
     def __hash__(self):
         return id(self)
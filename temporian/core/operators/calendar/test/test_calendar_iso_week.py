@@ -27,7 +27,7 @@ class CalendarIsoWeekTest(TestCase):
             "1970-01-05",  # Monday, ISO week 2
             "2023-01-01",  # Sunday, ISO week 52 (week 1 is the first to contain a Thursday)
             "2023-01-08",  # Sunday, ISO week 1
-            "2023-01-09",  # Monday, ISO week "2023-03-24", ISO week 1"2023-12-31", ISO week 52
+            "2023-01-09",  # Monday, ISO week 2
             "2023-03-24",  # ISO week 12
             "2023-12-31",  # ISO week 52
         ]
@@ -41,21 +41,22 @@ class Propagate(Operator):
 
         self._index_mapping: List[int] = []
 
-        sampling_index_name = sampling.schema.index_names()
+        sampling_index_name_to_idx = {
+            name: idx for idx, name in enumerate(sampling.schema.index_names())
+        }
         sampling_index_dtypes = sampling.schema.index_dtypes()
 
         for index in input.schema.indexes:
-            try:
-                sampling_idx = sampling_index_name.index(index.name)
-                self._index_mapping.append(sampling_idx)
-            except ValueError as exc:
+            sampling_idx = sampling_index_name_to_idx.get(index.name)
+            if sampling_idx is None:
                 raise ValueError(
                     "The indexes of input should be contained in the indexes of"
                     f' sampling. Index "{index.name}" from input is not'
                     " available in sampling. input.indexes="
                     f" {input.schema.indexes},"
                     f" sampling.indexes={sampling.schema.indexes}."
-                ) from exc
+                )
+            self._index_mapping.append(sampling_idx)
             if sampling_index_dtypes[sampling_idx] != index.dtype:
                 raise ValueError(
                     f'The index "{index.name}" is found both in the input and'
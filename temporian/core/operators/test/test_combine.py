@@ -156,6 +156,85 @@ class CombineTest(absltest.TestCase):
             check_sampling=False,
         )
 
+    def test_combine_same_timestamps(self):
+        # Events with the same timestamp are sorted by input order
+        evset_1 = event_set(
+            timestamps=[1, 2, 2, 5],
+            features={"a": [1, 2, 3, 4], "b": ["x", "y", "z", "w"]},
+        )
+        evset_2 = event_set(
+            timestamps=[0, 2, 5, 5],
+            features={"a": [5, 6, 7, 8], "b": ["xx", "yy", "zz", "ww"]},
+        )
+        evset_3 = event_set(
+            timestamps=[2, 6],
+            features={"a": [9, 10], "b": ["xxx", "yyy"]},
+        )
+        expected_output = event_set(
+            timestamps=[0, 1, 2, 2, 2, 2, 5, 5, 5, 6],
+            features={
+                "a": [5, 1, 2, 3, 6, 9, 4, 7, 8, 10],
+                "b": ["xx", "x", "y", "z", "yy", "xxx", "w", "zz", "ww", "yyy"],
+            },
+        )
+        assertOperatorResult(
+            self,
+            combine(evset_1, evset_2, evset_3, how=How.outer),
+            expected_output,
+            check_sampling=False,
+        )
+
+    def test_combine_two_interleaved(self):
+        evset_1 = event_set(
+            timestamps=[1, 3, 3, 6],
+            features={
+                "a": [True, False, True, True],
+                "b": ["x", "y", "z", "w"],
+            },
+        )
+        evset_2 = event_set(
+            timestamps=[0, 3, 4],
+            features={"a": [False, False, True], "b": ["xx", "yyy", "z"]},
+        )
+        expected_output = event_set(
+            timestamps=[0, 1, 3, 3, 3, 4, 6],
+            features={
+                "a": [False, True, False, True, False, True, True],
+                "b": ["xx", "x", "y", "z", "yyy", "z", "w"],
+            },
+        )
+        assertOperatorResult(
+            self,
+            combine(evset_1, evset_2, how=How.outer),
+            expected_output,
+            check_sampling=False,
+        )
+
+    def test_combine_consecutive(self):
+        # Inputs don't overlap in time, in order or not
+        evset_1 = event_set(timestamps=[0, 1, 2], features={"a": [1, 2, 3]})
+        evset_2 = event_set(timestamps=[2, 3], features={"a": [4, 5]})
+        evset_3 = event_set(timestamps=[-2, -1], features={"a": [6, 7]})
+
+        assertOperatorResult(
+            self,
+            combine(evset_1, evset_2, how=How.outer),
+            event_set(
+                timestamps=[0, 1, 2, 2, 3],
+                features={"a": [1, 2, 3, 4, 5]},
+            ),
+            check_sampling=False,
+        )
+        assertOperatorResult(
+            self,
+            combine(evset_1, evset_2, evset_3, how=How.outer),
+            event_set(
+                timestamps=[-2, -1, 0, 1, 2, 2, 3],
+                features={"a": [6, 7, 1, 2, 3, 4, 5]},
+            ),
+            check_sampling=False,
+        )
+
     def test_combine_multiple_indexed(self):
         evsets_list = []
         base_timestamps = np.array([0, 1, 2, -10, 0, 10])
@@ -193,6 +272,36 @@ class CombineTest(absltest.TestCase):
             check_sampling=False,
         )
 
+    def test_combine_many_same_timestamps(self):
+        # Enough inputs to merge them with a heap. Events with the same
+        # timestamp are sorted by input order.
+        n = 20
+        evsets_list = [
+            event_set(
+                timestamps=[1, 2, 2 + i % 3],
+                features={"a": [i, 100 + i, 200 + i], "b": ["x" * (i + 1)] * 3},
+            )
+            for i in range(n)
+        ]
+        events = sorted(
+            (timestamp, i, event_idx)
+            for i in range(n)
+            for event_idx, timestamp in enumerate([1, 2, 2 + i % 3])
+        )
+        expected_output = event_set(
+            timestamps=[timestamp for timestamp, _, _ in events],
+            features={
+                "a": [100 * event_idx + i for _, i, event_idx in events],
+                "b": ["x" * (i + 1) for _, i, _ in events],
+            },
+        )
+        assertOperatorResult(
+            self,
+            combine(*evsets_list, how=How.outer),
+            expected_output,
+            check_sampling=False,
+        )
+
     def test_combine_error_different_feature_names(self):
         # Test error msg when two events have different feature names
         evset_1 = event_set(
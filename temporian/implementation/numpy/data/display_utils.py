@@ -371,6 +371,7 @@ def display_text(evset: EventSet) -> str:
         threshold=max_events,
     ):
         data_repr = []
+        index_names = evset.schema.index_names()
 
         for i, index_key in enumerate(evset.get_index_keys(sort=True)):
             index_data = evset.data[index_key]
@@ -380,9 +381,7 @@ def display_text(evset: EventSet) -> str:
                 )
                 break
             index_key_repr = []
-            for index_value, index_name in zip(
-                index_key, evset.schema.index_names()
-            ):
+            for index_value, index_name in zip(index_key, index_names):
                 index_key_repr.append(f"{index_name}={index_value}")
             index_key_repr = " ".join(index_key_repr)
             timestamps = index_data.timestamps
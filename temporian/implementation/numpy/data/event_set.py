@@ -67,6 +67,8 @@ class IndexData:
         ```
     """
 
+    __slots__ = ("features", "timestamps")
+
     features: List[np.ndarray]
     timestamps: np.ndarray
 
@@ -136,10 +138,20 @@ class IndexData:
         if not isinstance(other, IndexData):
             return False
 
-        if not np.array_equal(self.timestamps, other.timestamps):
+        if self.timestamps is not other.timestamps and not np.array_equal(
+            self.timestamps, other.timestamps
+        ):
+            return False
+
+        if len(self.features) != len(other.features):
             return False
 
         for f1, f2 in zip(self.features, other.features):
+            if f1 is f2:
+                continue
+            if f1.shape != f2.shape:
+                # Note: np.allclose would broadcast arrays of different shapes.
+                return False
             if f1.dtype.kind == "f":
                 if not np.allclose(f1, f2, equal_nan=True):
                     return False
@@ -44,6 +44,33 @@ class EventSetTest(absltest.TestCase):
         self.evset.set_index_value((2, b"world"), modified)
         self.assertEqual(self.evset.get_index_value((2, b"world")), modified)
 
+    def test_index_data_eq(self):
+        timestamps = np.array([0.1, 0.2])
+        index_data = IndexData(
+            features=[np.array([1.0, np.nan]), np.array([1, 2])],
+            timestamps=timestamps,
+        )
+        self.assertEqual(index_data, index_data)
+        self.assertEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0, np.nan]), np.array([1, 2])],
+                timestamps=np.array([0.1, 0.2]),
+            ),
+        )
+        # Different number of features
+        self.assertNotEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0, np.nan])], timestamps=timestamps
+            ),
+        )
+        # Feature with a different shape that could be broadcasted
+        self.assertNotEqual(
+            IndexData(features=[np.array([1.0, 1.0])], timestamps=timestamps),
+            IndexData(features=[np.array([1.0])], timestamps=timestamps),
+        )
+
     def test_data_access(self):
         self.assertEqual(
             repr(self.evset.schema.features), "[('a', int64), ('b', int64)]"
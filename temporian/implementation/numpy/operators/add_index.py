@@ -39,6 +39,7 @@ class AddIndexNumpyImplementation(OperatorImplementation):
                 row_idxs,
                 group_begin_idx,
             ) = operators_cc.add_index_compute_index(index_features)
+            kept_features = [src_data.features[i] for i in kept_feature_idxs]
 
             for group_idx, group_key in enumerate(group_keys):
                 dst_index = src_index + group_key
@@ -49,8 +50,7 @@ class AddIndexNumpyImplementation(OperatorImplementation):
                 ]
                 dst_data[dst_index] = IndexData(
                     features=[
-                        src_data.features[f_idx][example_idxs]
-                        for f_idx in kept_feature_idxs
+                        feature[example_idxs] for feature in kept_features
                     ],
                     timestamps=src_data.timestamps[example_idxs],
                     schema=output_node.schema,
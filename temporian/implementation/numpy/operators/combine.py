@@ -16,7 +16,7 @@
 """Implementation for the Combine operator."""
 
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 import numpy as np
 
 from temporian.implementation.numpy.data.event_set import (
@@ -27,6 +27,7 @@ from temporian.core.operators.combine import Combine
 from temporian.core.operators.combine import How
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy_cc.operators import operators_cc
 
 
 class CombineNumpyImplementation(OperatorImplementation):
@@ -50,45 +51,75 @@ class CombineNumpyImplementation(OperatorImplementation):
         elif how == How.outer:
             combined_keys = set()
             for evset in input_evsets:
-                combined_keys |= set(evset.data.keys())
+                combined_keys.update(evset.data.keys())
         elif how == How.inner:
             combined_keys = set(first_input.data.keys())
             for evset in input_evsets[1:]:
-                combined_keys &= set(evset.data.keys())
+                combined_keys.intersection_update(evset.data.keys())
         else:
             raise ValueError(f"Unknown parameter for combine: {how=}")
 
-        # Concatenate timestamps and features for each index, and sort
+        # Position of the features of the first input in each input. None if
+        # the features are in the same order as in the first input.
+        feature_idxs_per_evset: List[Optional[List[int]]] = []
+        for evset in input_evsets:
+            evset_features = evset.schema.feature_names()
+            if evset_features == first_features:
+                feature_idxs_per_evset.append(None)
+                continue
+            name_to_idx = {name: idx for idx, name in enumerate(evset_features)}
+            feature_idxs_per_evset.append(
+                [name_to_idx[name] for name in first_features]
+            )
+
+        # For each index key, use the events of the only input that contains
+        # it, concatenate the inputs if they don't overlap in time, or merge
+        # them by timestamp.
         for index_key in combined_keys:
             all_timestamps: List[np.ndarray] = []
+            timestamps: np.ndarray
+            features: List[np.ndarray]
             # Outer list contains each feature, inner list each evset
             all_feats: List[List[np.ndarray]] = [[] for _ in first_features]
 
             # Get timestamps and features from all input EventSets
-            for evset in input_evsets:
-                if index_key not in evset.data:
+            for evset, feature_idxs in zip(
+                input_evsets, feature_idxs_per_evset
+            ):
+                index_data = evset.data.get(index_key)
+                if index_data is None:
                     continue
-                index_data = evset.get_index_value(index_key, normalize=False)
                 all_timestamps.append(index_data.timestamps)
 
-                # Find features by name and put them in the right position
-                source_feats = evset.schema.feature_names()
-                for target_idx, feat in enumerate(first_features):
-                    source_idx = source_feats.index(feat)
-                    all_feats[target_idx].append(
-                        index_data.features[source_idx]
-                    )
-
-            # Concatenate and sort timestamps
-            timestamps: np.ndarray = np.concatenate(all_timestamps)
-            time_position = np.argsort(timestamps, kind="mergesort")
-            timestamps = timestamps[time_position]
-
-            # Concatenate features and sort based on timestamps
-            features: List[np.ndarray] = []
-            for idx in range(len(first_features)):
-                feat = np.concatenate(all_feats[idx])
-                features.append(feat[time_position])
+                # Put the features in the same order as the first input
+                if feature_idxs is None:
+                    evset_features = index_data.features
+                else:
+                    evset_features = [
+                        index_data.features[idx] for idx in feature_idxs
+                    ]
+                for feats, feature in zip(all_feats, evset_features):
+                    feats.append(feature)
+
+            if len(all_timestamps) == 1:
+                # Only one input contains this index key. Its data is already
+                # sorted and is used as is.
+                timestamps = all_timestamps[0]
+                features = [feats[0] for feats in all_feats]
+            elif _is_concatenation_sorted(all_timestamps):
+                # The inputs don't overlap in time. Their concatenation is
+                # already sorted.
+                timestamps = np.concatenate(all_timestamps)
+                features = [np.concatenate(feats) for feats in all_feats]
+            else:
+                # Merge the already sorted timestamps of each input, and
+                # gather the features in the same order.
+                timestamps, time_position = operators_cc.combine_merge(
+                    all_timestamps
+                )
+                features = [
+                    np.concatenate(feats)[time_position] for feats in all_feats
+                ]
 
             # Fill IndexData
             output_evset.set_index_value(
@@ -104,6 +135,19 @@ class CombineNumpyImplementation(OperatorImplementation):
         return {"output": output_evset}
 
 
+def _is_concatenation_sorted(timestamps: List[np.ndarray]) -> bool:
+    """Checks if the concatenation of sorted timestamps is sorted."""
+
+    last_timestamp = None
+    for src_timestamps in timestamps:
+        if len(src_timestamps) == 0:
+            continue
+        if last_timestamp is not None and src_timestamps[0] < last_timestamp:
+            return False
+        last_timestamp = src_timestamps[-1]
+    return True
+
+
 implementation_lib.register_operator_implementation(
     Combine, CombineNumpyImplementation
 )
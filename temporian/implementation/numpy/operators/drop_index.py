@@ -7,6 +7,7 @@ from temporian.core.operators.drop_index import DropIndexOperator
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy_cc.operators import operators_cc
 
 
 class DstIndexGroup:
@@ -67,28 +68,31 @@ class DropIndexNumpyImplementation(OperatorImplementation):
             )
 
         # Aggredates the data
-        #
-        # TODO: this is merging sorted arrays, we should later improve this code
-        # by avoiding the full sort
         dst_evset: Dict[tuple, IndexData] = {}
         output_schema = self.output_schema("output")
         num_output_features = len(self.operator.output_feature_schemas)
         for dst_index_key, group in dst_index_groups.items():
-            # Append together all the timestamps.
-            aggregated_timestamps = np.concatenate(group.timestamps)
-
-            # Sort the timestamps.
-            sorted_idxs = np.argsort(aggregated_timestamps, kind="mergesort")
-
-            # Append together and sort (according to the timestamps) all the feature values.
-            aggregated_features = [
-                np.concatenate([f[idx] for f in group.features])[sorted_idxs]
-                for idx in range(num_output_features)
-            ]
+            if len(group.timestamps) == 1:
+                # Only one source index contains this index key. Its data is
+                # already sorted and is used as is.
+                aggregated_timestamps = group.timestamps[0]
+                aggregated_features = group.features[0]
+            else:
+                # Merge the already sorted timestamps of each source index.
+                aggregated_timestamps, order = operators_cc.combine_merge(
+                    group.timestamps
+                )
+
+                # Append together and sort (according to the timestamps) all
+                # the feature values.
+                aggregated_features = [
+                    np.concatenate([f[idx] for f in group.features])[order]
+                    for idx in range(num_output_features)
+                ]
 
             dst_evset[dst_index_key] = IndexData(
                 features=aggregated_features,
-                timestamps=aggregated_timestamps[sorted_idxs],
+                timestamps=aggregated_timestamps,
                 schema=output_schema,
             )
 
@@ -51,20 +51,17 @@ class BaseScalarNumpyImplementation(OperatorImplementation, ABC):
         assert isinstance(self.operator, BaseScalarOperator)
         output_schema = self.output_schema("output")
 
+        value = self.operator.value
+        dtypes = [feature.dtype for feature in input.schema.features]
+
         dst_evset = EventSet(data={}, schema=output_schema)
         for index_key, index_data in input.data.items():
             dst_evset.set_index_value(
                 index_key,
                 IndexData(
                     [
-                        self._do_operation(
-                            feature,
-                            self.operator.value,
-                            input.schema.features[feature_idx].dtype,
-                        )
-                        for feature_idx, feature in enumerate(
-                            index_data.features
-                        )
+                        self._do_operation(feature, value, dtype)
+                        for feature, dtype in zip(index_data.features, dtypes)
                     ],
                     index_data.timestamps,
                     schema=output_schema,
@@ -0,0 +1,148 @@
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include <cstdint>
+#include <functional>
+#include <queue>
+#include <tuple>
+#include <vector>
+
+#include "temporian/implementation/numpy_cc/operators/common.h"
+
+namespace {
+namespace py = pybind11;
+
+// Number of sources above which the next event is selected with a heap
+// instead of a linear scan over the sources.
+constexpr std::size_t kMaxSourcesLinearScan = 16;
+
+typedef py::detail::unchecked_reference<double, 1> TimestampsRef;
+typedef py::detail::unchecked_mutable_reference<double, 1> MergedRef;
+typedef py::detail::unchecked_mutable_reference<Idx, 1> OrderRef;
+
+// Merges two sources. The selection of the next event is branchless, which
+// matters since it is not predictable when the sources are interleaved.
+void merge_two(const TimestampsRef &left, const TimestampsRef &right,
+               MergedRef *merged, OrderRef *order) {
+  const Idx n_left = left.shape(0);
+  Idx left_idx = 0;
+  Idx right_idx = 0;
+  Idx dst_idx = 0;
+  while (left_idx < left.shape(0) && right_idx < right.shape(0)) {
+    const double left_t = left(left_idx);
+    const double right_t = right(right_idx);
+    // In case of a tie, the left source is selected.
+    const bool select_right = right_t < left_t;
+    (*merged)(dst_idx) = select_right ? right_t : left_t;
+    (*order)(dst_idx++) = select_right ? n_left + right_idx : left_idx;
+    left_idx += !select_right;
+    right_idx += select_right;
+  }
+  for (; left_idx < left.shape(0); left_idx++) {
+    (*merged)(dst_idx) = left(left_idx);
+    (*order)(dst_idx++) = left_idx;
+  }
+  for (; right_idx < right.shape(0); right_idx++) {
+    (*merged)(dst_idx) = right(right_idx);
+    (*order)(dst_idx++) = n_left + right_idx;
+  }
+}
+
+// Merges the sources by scanning all of them for each output event. Faster
+// than a heap for a small number of sources.
+void merge_linear_scan(const std::vector<TimestampsRef> &timestamps,
+                       const std::vector<Idx> &offsets, MergedRef *merged,
+                       OrderRef *order) {
+  const std::size_t n_sources = timestamps.size();
+  std::vector<Idx> cursors(n_sources, 0);
+  const Idx n_total = offsets.back();
+  for (Idx dst_idx = 0; dst_idx < n_total; dst_idx++) {
+    // Select the source with the smallest next timestamp. In case of a tie,
+    // the source with the smallest index is selected.
+    std::size_t selected = n_sources;
+    double selected_timestamp = 0;
+    for (std::size_t src = 0; src < n_sources; src++) {
+      if (cursors[src] == timestamps[src].shape(0)) {
+        continue;
+      }
+      const double t = timestamps[src](cursors[src]);
+      if (selected == n_sources || t < selected_timestamp) {
+        selected = src;
+        selected_timestamp = t;
+      }
+    }
+    (*merged)(dst_idx) = selected_timestamp;
+    (*order)(dst_idx) = offsets[selected] + cursors[selected]++;
+  }
+}
+
+// Merges the sources with a min-heap of their next timestamps.
+void merge_heap(const std::vector<TimestampsRef> &timestamps,
+                const std::vector<Idx> &offsets, MergedRef *merged,
+                OrderRef *order) {
+  // Next timestamp, source index and cursor in the source. Ties on the
+  // timestamp are broken by the source index.
+  typedef std::tuple<double, std::size_t, Idx> Item;
+  std::priority_queue<Item, std::vector<Item>, std::greater<Item>> heap;
+  for (std::size_t src = 0; src < timestamps.size(); src++) {
+    if (timestamps[src].shape(0) > 0) {
+      heap.emplace(timestamps[src](0), src, 0);
+    }
+  }
+
+  Idx dst_idx = 0;
+  while (!heap.empty()) {
+    const auto [t, src, cursor] = heap.top();
+    heap.pop();
+    (*merged)(dst_idx) = t;
+    (*order)(dst_idx++) = offsets[src] + cursor;
+    if (cursor + 1 < timestamps[src].shape(0)) {
+      heap.emplace(timestamps[src](cursor + 1), src, cursor + 1);
+    }
+  }
+}
+
+// Merges sorted timestamps.
+//
+// The order is equivalent to a stable argsort of the concatenated timestamps
+// i.e., events with the same timestamp are ordered by the index of their
+// source.
+//
+// Args:
+//   timestamps: List of sorted float64 timestamp arrays.
+//
+// Returns:
+//   The merged timestamps, and the indices of the merged events in the
+//   concatenation of "timestamps".
+std::tuple<py::array_t<double>, py::array_t<Idx>> combine_merge(
+    const py::list &timestamps) {
+  std::vector<py::array_t<double>> arrays;
+  std::vector<TimestampsRef> refs;
+  std::vector<Idx> offsets = {0};
+  arrays.reserve(timestamps.size());
+  refs.reserve(timestamps.size());
+  for (const auto &item : timestamps) {
+    arrays.push_back(py::cast<py::array_t<double>>(item));
+    refs.push_back(arrays.back().unchecked<1>());
+    offsets.push_back(offsets.back() + arrays.back().shape(0));
+  }
+
+  auto merged = py::array_t<double>(offsets.back());
+  auto order = py::array_t<Idx>(offsets.back());
+  auto v_merged = merged.mutable_unchecked<1>();
+  auto v_order = order.mutable_unchecked<1>();
+  if (refs.size() == 2) {
+    merge_two(refs[0], refs[1], &v_merged, &v_order);
+  } else if (refs.size() <= kMaxSourcesLinearScan) {
+    merge_linear_scan(refs, offsets, &v_merged, &v_order);
+  } else {
+    merge_heap(refs, offsets, &v_merged, &v_order);
+  }
+  return std::make_tuple(merged, order);
+}
+
+}  // namespace
+
+void init_combine(py::module &m) {
+  m.def("combine_merge", &combine_merge, "", py::arg("timestamps"));
+}
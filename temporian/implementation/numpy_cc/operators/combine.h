@@ -0,0 +1,4 @@
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+void init_combine(pybind11::module &m);
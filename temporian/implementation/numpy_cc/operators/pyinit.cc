@@ -2,6 +2,7 @@
 #include <pybind11/pybind11.h>
 
 #include "temporian/implementation/numpy_cc/operators/add_index.h"
+#include "temporian/implementation/numpy_cc/operators/combine.h"
 #include "temporian/implementation/numpy_cc/operators/filter_moving_count.h"
 #include "temporian/implementation/numpy_cc/operators/join.h"
 #include "temporian/implementation/numpy_cc/operators/resample.h"
@@ -23,4 +24,5 @@ PYBIND11_MODULE(operators_cc, m) {
   init_tick_calendar(m);
   init_filter_moving_count(m);
   init_until_next(m);
+  init_combine(m);
 }
@@ -77,11 +77,20 @@ def from_pandas(
         ValueError: If a column has an unsupported dtype.
     """
 
-    feature_dict = df.drop(columns=timestamps).to_dict("series")
+    timestamp_values = df[timestamps].to_numpy()
+
+    # Read the columns directly instead of going through a copy of the
+    # DataFrame without the timestamp column. The values are copied so the
+    # EventSet doesn't share memory with the DataFrame.
+    feature_values = {
+        column: df[column].to_numpy(copy=True)
+        for column in df.columns
+        if column != timestamps
+    }
 
     return event_set(
-        timestamps=df[timestamps].to_numpy(),
-        features={k: v.to_numpy() for k, v in feature_dict.items()},
+        timestamps=timestamp_values,
+        features=feature_values,
         indexes=indexes,
         name=name,
         same_sampling_as=same_sampling_as,
@@ -136,14 +145,11 @@ def to_pandas(
 
     timestamp_key = "timestamp"
 
-    index_names = evset.schema.index_names()
     feature_names = evset.schema.feature_names()
 
-    column_names = index_names + feature_names + [timestamp_key]
+    column_names = feature_names + [timestamp_key]
     dst = {column_name: [] for column_name in column_names}
-    for index, data in evset.data.items():
-        assert isinstance(index, tuple)
-
+    for data in evset.data.values():
         # Timestamps
         dst[timestamp_key].append(data.timestamps)
 
@@ -151,19 +157,24 @@ def to_pandas(
         for feature_name, feature in zip(feature_names, data.features):
             dst[feature_name].append(feature)
 
-        # Indexes
-        num_timestamps = len(data.timestamps)
-        for index_name, index_item in zip(index_names, index):
-            dst[index_name].append(np.repeat(index_item, num_timestamps))
-
     dst = {k: np.concatenate(v) for k, v in dst.items()}
 
+    # Indexes. Each index value is repeated for all the events of its index
+    # key, in a single call per index.
+    num_timestamps = [len(data.timestamps) for data in evset.data.values()]
+    index_dst = {}
+    for index_idx, index in enumerate(evset.schema.indexes):
+        index_values = np.array([key[index_idx] for key in evset.data.keys()])
+        if tp_string_to_pd_string and index.dtype == DType.STRING:
+            index_values = index_values.astype(str)
+        index_dst[index.name] = np.repeat(index_values, num_timestamps)
+    dst = {**index_dst, **dst}
+
     if tp_string_to_pd_string:
         for feature in evset.schema.features:
             if feature.dtype == DType.STRING:
                 dst[feature.name] = dst[feature.name].astype(str)
-        for index in evset.schema.indexes:
-            if index.dtype == DType.STRING:
-                dst[index.name] = dst[index.name].astype(str)
 
-    return pd.DataFrame(dst)
+    # The columns are new arrays owned by the DataFrame. Not copying them also
+    # avoids consolidating the columns with the same dtype into a single block.
+    return pd.DataFrame(dst, copy=False)
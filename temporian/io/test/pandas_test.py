@@ -370,6 +370,20 @@ class DataFrameToEventTest(absltest.TestCase):
         evset = from_pandas(df, indexes=[], timestamps="timestamp")
         self.assertEqual(evset, expected_evset)
 
+    def test_no_shared_memory(self) -> None:
+        df = pd.DataFrame(
+            {"timestamp": [1.0, 2.0, 3.0], "a": [1.0, 2.0, 3.0]},
+        )
+        evset = from_pandas(df)
+
+        # Modifying the DataFrame doesn't modify the EventSet
+        df.loc[0, "a"] = 100.0
+        df.loc[0, "timestamp"] = 0.5
+        self.assertEqual(
+            evset,
+            event_set(timestamps=[1.0, 2.0, 3.0], features={"a": [1, 2.0, 3]}),
+        )
+
     def test_datetime_in_feature_column(self) -> None:
         df = pd.DataFrame(
             [